@@ -17,6 +17,7 @@ API Endpoints:
     GET /           - API root and version info
     GET /status     - Connection status to iRacing
     GET /telemetry  - Current telemetry data
+    WS  /telemetry/ws - Telemetry pushed at 60 Hz
     GET /session    - Session/track/car information
     POST /disconnect - Disconnect from iRacing
 
@@ -33,40 +34,241 @@ Author: Forseti Development Team
 Version: 1.0.0
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
+from pydantic import BaseModel
 import irsdk
+import orjson
 import uvicorn
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Set, Tuple, TypeVar
+import asyncio
+import hashlib
+import logging
+import mmap
+import os
+import re
+import struct
+import sys
 import time
 
+T = TypeVar("T")
+
+# Shares uvicorn's error log, so background task failures show up with request errors
+logger = logging.getLogger("uvicorn.error")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+@dataclass(slots=True)
+class TelemetryFrame:
+    """
+    One telemetry snapshot, serialized natively by orjson.
+
+    Also the response model of GET /telemetry and the source of the shared
+    memory layout, so the fields are only declared here.
+    """
+    speed: float
+    rpm: float
+    gear: int
+    throttle: float
+    brake: float
+    steering: float
+    lapCurrentLapTime: float
+    lapLastLapTime: float
+    lapNumber: int
+    sessionTime: float
+    sessionTimeRemain: float
+    isOnTrack: bool
+    lapDistPct: float
+    trackLength: float
+    timestamp: float
+
+
+@dataclass(frozen=True, slots=True)
+class SessionConstants:
+    """Session fields that only change when a new session starts."""
+    session_id: Optional[int]  # SessionUniqueID
+    event_id: tuple  # (SessionID, SubSessionID) from WeekendInfo
+    track_name: str
+    track_id: int
+    session_type: str
+    driver_name: str
+    car_name: str
+    track_length: float  # Meters
+
+
+class ServiceInfo(BaseModel):
+    """Response body of GET /."""
+    service: str
+    version: str
+    status: str
+
+
+class ConnectionStatus(BaseModel):
+    """Response body of GET /status."""
+    connected: bool
+    initialized: bool
+    timestamp: float
+    error: Optional[str] = None
+
+
+class Session(BaseModel):
+    """Response body of GET /session."""
+    trackName: str
+    trackId: int
+    sessionType: str
+    driverName: str
+    carName: str
+    fastestLap: float
+    trackLength: float
+    trackTemperature: Optional[float] = None
+    airTemperature: Optional[float] = None
+    trackCondition: str
+    timestamp: float
+
+
+class DisconnectResult(BaseModel):
+    """Response body of POST /disconnect."""
+    status: str
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global telemetry_shm
     # Startup
+    if SHARED_TELEMETRY_ENABLED:
+        telemetry_shm = mmap.mmap(-1, TELEMETRY_SHM_SIZE, tagname=TELEMETRY_SHM_NAME)
+    await check_connection()
+    watchdog = asyncio.create_task(connection_watchdog())
+    pump = asyncio.create_task(telemetry_pump())
     yield
     # Shutdown
+    pump.cancel()
+    watchdog.cancel()
+    if telemetry_shm is not None:
+        async with sdk_lock:
+            telemetry_shm.close()
+            telemetry_shm = None
     try:
         ir.shutdown()
     except:
         pass
 
-app = FastAPI(title="Forseti iRacing Bridge", version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="Forseti iRacing Bridge",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
-# Enable CORS for Electron app
+# Enable CORS for the web app (hosted, or served locally in development).
+# The Electron main process calls the bridge from Node and is not subject to CORS.
+WEB_APP_ORIGIN = os.environ.get("FORSETI_WEB_URL", "https://forseti-web-173360556184.us-central1.run.app").rstrip("/")
+LOCAL_ORIGIN_REGEX = r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$"
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=[WEB_APP_ORIGIN],
+    allow_origin_regex=LOCAL_ORIGIN_REGEX,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compress responses of 1 KiB or more; telemetry and today's session payloads
+# are smaller and pass through. Level 1, since CPU matters more than ratio on loopback.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
 
 # Global iRacing SDK instance
 ir = irsdk.IRSDK()
-last_telemetry_update = 0
-telemetry_cache = {}
-session_cache = {}
+# pyirsdk is not thread-safe, so only one worker thread may use it at a time
+sdk_lock = asyncio.Lock()
+# Connection state as last seen by connection_watchdog
+sdk_connected = False
+connection_error: Optional[str] = None
+# Serialized telemetry JSON and the time.monotonic() it was read at
+last_telemetry_update = 0.0
+telemetry_cache = b""
+telemetry_refresh: Optional[asyncio.Task] = None
+telemetry_layout: Optional[Tuple[struct.Struct, int, list]] = None
+telemetry_clients: Set[WebSocket] = set()
+# Named shared memory mirror of the latest telemetry and its seqlock counter
+telemetry_shm: Optional[mmap.mmap] = None
+telemetry_shm_sequence = 0
+# Serialized session JSON, the payload it was built from and its cache key
+session_cache = b""
+session_data: Dict[str, Any] = {}
+session_cache_key: Optional[tuple] = None
+session_constants: Optional[SessionConstants] = None
+session_conditions_expiry = 0.0
+# Fastest lap per session index as (result count, time), for one event
+fastest_laps: Dict[int, Tuple[int, float]] = {}
+# ETag of session_cache, which ignores its timestamp
+session_cache_etag = ""
+fastest_laps_event: Optional[tuple] = None
+
+# (TelemetryFrame field, SDK variable, default when the variable is unavailable).
+# trackLength comes from session_constants and timestamp from the read time.
+TELEMETRY_FIELDS = (
+    ("speed", "Speed", 0),
+    ("rpm", "RPM", 0),
+    ("gear", "Gear", 0),
+    ("throttle", "Throttle", 0),
+    ("brake", "Brake", 0),
+    ("steering", "SteeringWheelAngle", 0),
+    ("lapCurrentLapTime", "LapCurrentLapTime", 0),
+    ("lapLastLapTime", "LapLastLapTime", 0),
+    ("lapNumber", "Lap", 0),
+    ("sessionTime", "SessionTime", 0),
+    ("sessionTimeRemain", "SessionTimeRemain", 0),
+    ("isOnTrack", "IsOnTrack", False),
+    ("lapDistPct", "LapDistPct", 0),  # Lap distance as percentage (0-1)
+)
+assert {field for field, _, _ in TELEMETRY_FIELDS} | {"trackLength", "timestamp"} == set(TelemetryFrame.__slots__), \
+    "TELEMETRY_FIELDS does not match TelemetryFrame"
+
+# Seconds between connection checks (and ir.startup() attempts while disconnected)
+CONNECTION_CHECK_INTERVAL = 1.0
+
+# trackCondition reported for each TrackWetness value: 0=unknown, 1=dry,
+# 2=mostly_dry, 3=very_lightly_wet, 4=lightly_wet, 5=moderately_wet, 6=very_wet,
+# 7=extremely_wet. Clients only understand dry/wet, so unknown reports dry.
+TRACK_WETNESS_CONDITIONS = ("dry", "dry", "dry", "wet", "wet", "wet", "wet", "wet")
+
+# Seconds between telemetry pushes to WebSocket clients (the SDK updates at 60 Hz)
+TELEMETRY_PUSH_INTERVAL = 1 / 60
+# Seconds a WebSocket client may take to accept a frame before it is dropped
+TELEMETRY_SEND_TIMEOUT = 0.25
+
+# Opt-in shared memory mirror of the telemetry for co-located readers (Windows only).
+# Layout: uint32 sequence number, then TELEMETRY_SHM_FRAME. The sequence is odd
+# while a frame is being written; readers retry until it is even and unchanged
+# across their read.
+SHARED_TELEMETRY_ENABLED = sys.platform == "win32" and os.environ.get("FORSETI_SHARED_TELEMETRY") == "1"
+TELEMETRY_SHM_NAME = "ForsetiTelemetry"
+TELEMETRY_SHM_SEQUENCE = struct.Struct("<I")
+# TelemetryFrame fields in order, packed by their annotated type
+TELEMETRY_SHM_CODES = {float: "d", int: "i", bool: "?"}
+TELEMETRY_SHM_FRAME = struct.Struct("<" + "".join(TELEMETRY_SHM_CODES[field.type] for field in fields(TelemetryFrame)))
+TELEMETRY_SHM_SIZE = TELEMETRY_SHM_SEQUENCE.size + TELEMETRY_SHM_FRAME.size
+
+# Meters per unit of the WeekendInfo TrackLength string
+TRACK_LENGTH_UNITS = {"km": 1000, "mi": 1609.344}
+
+# Temperatures and track wetness in the session payload are refreshed this often
+SESSION_CONDITIONS_TTL = 5.0
+
+# Telemetry younger than this is served without touching the SDK
+TELEMETRY_CACHE_TTL = 0.015
+# Telemetry up to one SDK tick (60 Hz) past the TTL is served while it refreshes
+TELEMETRY_STALE_TTL = TELEMETRY_CACHE_TTL + 1 / 60
 
 
 def is_connected() -> bool:
@@ -79,13 +281,51 @@ def is_connected() -> bool:
     return ir.is_initialized and ir.is_connected
 
 
+def resolve_telemetry_layout() -> Tuple[struct.Struct, int, list]:
+    """
+    Compile one struct.Struct that decodes every telemetry variable at once.
+
+    pyirsdk's item lookup searches the variable table by name and unpacks each
+    value separately. Sorting the TELEMETRY_FIELDS variables by their offset in
+    the var buffer and padding the gaps between them gives a single format
+    that decodes all of them with one unpack_from call.
+
+    Returns:
+        tuple: (compiled struct, offset of the first variable in the var buffer,
+            index into the unpacked values per field, or None for variables the
+            current iRacing build does not provide).
+    """
+    var_headers = ir._var_headers_dict or {}
+    available = sorted(
+        (var_headers[var].offset, field_index, var_headers[var])
+        for field_index, (_, var, _) in enumerate(TELEMETRY_FIELDS)
+        if var in var_headers
+    )
+
+    start = available[0][0] if available else 0
+    position = start
+    fmt = "<"
+    indexes = [None] * len(TELEMETRY_FIELDS)
+    for value_index, (offset, field_index, header) in enumerate(available):
+        if offset > position:
+            fmt += "%dx" % (offset - position)
+        # All telemetry fields are scalars, so count is always 1
+        code = irsdk.VAR_TYPE_MAP[header.type]
+        fmt += code
+        position = offset + struct.calcsize("<" + code)
+        indexes[field_index] = value_index
+
+    return struct.Struct(fmt), start, indexes
+
+
 def ensure_connection() -> bool:
     """
     Ensure connection to iRacing, attempting to connect if not already connected.
 
     This function checks the current connection state and attempts to initialize
-    the SDK and establish a connection if needed. It includes a brief delay to
-    allow the connection to stabilize.
+    the SDK and establish a connection if needed. It is only called by
+    connection_watchdog, which paces the attempts, so request handlers never
+    pay for ir.startup() while iRacing is not running.
 
     Returns:
         bool: True if connection is established, False otherwise.
@@ -94,19 +334,111 @@ def ensure_connection() -> bool:
         The SDK must be initialized before it can connect to iRacing.
         iRacing must be running for the connection to succeed.
     """
-    if not ir.is_initialized:
-        ir.startup()
+    global telemetry_layout, session_constants, session_cache_key
 
-    if not ir.is_connected:
-        # Try to connect
-        ir.startup()
-        time.sleep(0.1)  # Give it a moment
+    if ir.is_initialized and ir.is_connected:
+        return True
+
+    # Try to connect
+    ir.startup()
+    # Variable layout and session may differ after reconnecting; clearing the
+    # cache key makes the next /session read rebuild instead of patching
+    telemetry_layout = None
+    session_constants = None
+    session_cache_key = None
 
     return ir.is_connected
 
 
-@app.get("/")
-def root():
+def require_connection() -> None:
+    """
+    Raise unless the SDK is connected. Runs in a worker thread via run_sdk.
+
+    Catches iRacing going away between two connection_watchdog checks.
+
+    Raises:
+        HTTPException 503: Not connected to iRacing
+    """
+    global sdk_connected
+
+    if not is_connected():
+        sdk_connected = False
+        raise HTTPException(status_code=503, detail="Not connected to iRacing")
+
+
+async def run_sdk(func: Callable[[], T]) -> T:
+    """
+    Run a blocking SDK function in a worker thread.
+
+    Calls are serialized through sdk_lock so the event loop stays free to
+    serve other requests while a single thread talks to iRacing.
+
+    Args:
+        func: Synchronous function that reads from or controls the SDK.
+
+    Returns:
+        The return value of func.
+    """
+    async with sdk_lock:
+        return await asyncio.to_thread(func)
+
+
+def refresh_session_constants() -> None:
+    """
+    Reload session_constants when a new session starts.
+
+    Called on every connection check, so the trackLength in /telemetry follows
+    track changes without waiting for a /session request. Runs in a worker
+    thread via run_sdk.
+    """
+    global session_constants
+
+    try:
+        ir.unfreeze_var_buffer_latest()
+        session_id = ir["SessionUniqueID"]
+        if session_constants is None or session_constants.session_id != session_id:
+            session_constants = _read_session_constants(session_id)
+    except Exception:
+        # Malformed session info; /session reports the error when requested
+        pass
+
+
+def _check_connection_sync() -> bool:
+    """Connect if needed and keep session_constants current. Runs in a worker thread via run_sdk."""
+    connected = ensure_connection()
+    if connected:
+        refresh_session_constants()
+    return connected
+
+
+async def check_connection():
+    """Connect to iRacing if needed and record the result in sdk_connected."""
+    global sdk_connected, connection_error
+
+    try:
+        sdk_connected = await run_sdk(_check_connection_sync)
+        connection_error = None
+    except Exception as e:
+        sdk_connected = False
+        connection_error = str(e)
+
+
+async def connection_watchdog():
+    """
+    Keep the SDK connected in the background.
+
+    Checks the connection every CONNECTION_CHECK_INTERVAL seconds, calls
+    ir.startup() while disconnected and reloads session_constants when the
+    session changes. Request handlers only look at
+    sdk_connected and reject requests straight away while it is False.
+    """
+    while True:
+        await asyncio.sleep(CONNECTION_CHECK_INTERVAL)
+        await check_connection()
+
+
+@app.get("/", response_model=ServiceInfo)
+async def root():
     """
     API root endpoint.
 
@@ -115,20 +447,21 @@ def root():
     Returns:
         dict: Service name, version, and status.
     """
-    return {
+    return ORJSONResponse({
         "service": "Forseti iRacing Bridge",
         "version": "1.0.0",
         "status": "running"
-    }
+    })
 
 
-@app.get("/status")
-def get_status():
+@app.get("/status", response_model=ConnectionStatus)
+async def get_status():
     """
     Get current connection status to iRacing.
 
-    Checks if the SDK is initialized and connected to the iRacing simulation.
-    Will attempt to establish connection if not already connected.
+    Reports whether the SDK is initialized and connected to the iRacing
+    simulation, as last seen by connection_watchdog, which keeps trying to
+    connect in the background.
 
     Returns:
         dict: Connection status with fields:
@@ -137,29 +470,91 @@ def get_status():
             - timestamp (float): Unix timestamp of status check
             - error (str, optional): Error message if connection failed
     """
-    try:
-        connected = ensure_connection()
-        return {
-            "connected": connected,
-            "initialized": ir.is_initialized,
-            "timestamp": time.time()
-        }
-    except Exception as e:
-        return {
+    if connection_error is not None:
+        return ORJSONResponse({
             "connected": False,
             "initialized": False,
-            "error": str(e),
+            "error": connection_error,
             "timestamp": time.time()
-        }
+        })
+    return ORJSONResponse({
+        "connected": sdk_connected,
+        "initialized": ir.is_initialized,
+        "timestamp": time.time()
+    })
+
+
+def _read_telemetry_sync() -> bytes:
+    """Read and cache serialized telemetry. Runs in a worker thread via run_sdk."""
+    global last_telemetry_update, telemetry_cache, telemetry_layout
+
+    require_connection()
 
+    try:
+        # Freeze the data to get consistent values
+        ir.freeze_var_buffer_latest()
 
-@app.get("/telemetry")
-def get_telemetry():
+        if telemetry_layout is None:
+            telemetry_layout = resolve_telemetry_layout()
+        layout, start, indexes = telemetry_layout
+
+        # Decode every variable from the frozen buffer in one call, substituting
+        # defaults for variables that are unavailable
+        var_buffer = ir._var_buffer_latest
+        values = layout.unpack_from(var_buffer.get_memory(), var_buffer.buf_offset + start)
+        telemetry = TelemetryFrame(
+            **{
+                field: default if index is None else values[index]
+                for (field, _, default), index in zip(TELEMETRY_FIELDS, indexes)
+            },
+            trackLength=session_constants.track_length if session_constants else 0,  # Track length in meters
+            timestamp=time.time(),
+        )
+
+        telemetry_cache = orjson.dumps(telemetry)
+        last_telemetry_update = time.monotonic()
+        if telemetry_shm is not None:
+            write_shared_telemetry(telemetry)
+
+        return telemetry_cache
+
+    except Exception as e:
+        if telemetry_cache:
+            # Return cached data if available
+            return telemetry_cache
+        raise HTTPException(status_code=500, detail=f"Error reading telemetry: {str(e)}")
+
+
+def refresh_telemetry() -> asyncio.Task:
+    """
+    Start a telemetry read unless one is already in flight.
+
+    Concurrent callers share the same task, so any number of clients that
+    miss the cache at once cost a single SDK read.
+
+    Returns:
+        asyncio.Task: The in-flight read, resolving to serialized telemetry.
+    """
+    global telemetry_refresh
+
+    if telemetry_refresh is None or telemetry_refresh.done():
+        telemetry_refresh = asyncio.create_task(run_sdk(_read_telemetry_sync))
+        # Background refreshes may have no awaiter; mark errors as retrieved
+        telemetry_refresh.add_done_callback(lambda task: task.cancelled() or task.exception())
+    return telemetry_refresh
+
+
+@app.get("/telemetry", response_model=TelemetryFrame)
+async def get_telemetry():
     """
     Get current telemetry data from iRacing.
 
     Retrieves real-time car telemetry including speed, engine data, and driver inputs.
     Data is cached to provide resilience if the connection is temporarily lost.
+    Reads within TELEMETRY_CACHE_TTL of each other share one SDK read; slightly
+    older data is returned immediately while a background refresh runs, and
+    concurrent cache misses wait on a single in-flight read. While WebSocket
+    clients are streaming, this returns the frame last pushed to them.
 
     Returns:
         dict: Telemetry data with fields:
@@ -183,53 +578,342 @@ def get_telemetry():
         HTTPException 503: Not connected to iRacing
         HTTPException 500: Error reading telemetry data
     """
-    global last_telemetry_update, telemetry_cache
-
-    if not ensure_connection():
+    if not sdk_connected:
         raise HTTPException(status_code=503, detail="Not connected to iRacing")
 
+    age = time.monotonic() - last_telemetry_update
+    if telemetry_cache and age < TELEMETRY_STALE_TTL:
+        if age >= TELEMETRY_CACHE_TTL:
+            refresh_telemetry()
+        return Response(content=telemetry_cache, media_type="application/json")
+
+    # Shielded so a client disconnecting does not cancel the shared read
+    telemetry = await asyncio.shield(refresh_telemetry())
+    return Response(content=telemetry, media_type="application/json")
+
+
+async def push_telemetry(client: WebSocket, frame: bytes) -> None:
+    """
+    Send one frame to a WebSocket client, dropping the client if it fails.
+
+    A client that does not take the frame within TELEMETRY_SEND_TIMEOUT is
+    closed, so one slow reader cannot hold up the others.
+
+    Args:
+        client: Connected telemetry client.
+        frame: Serialized telemetry.
+    """
     try:
-        # Freeze the data to get consistent values
+        await asyncio.wait_for(client.send_bytes(frame), TELEMETRY_SEND_TIMEOUT)
+    except Exception:
+        telemetry_clients.discard(client)
+        try:
+            await asyncio.wait_for(client.close(code=1013), TELEMETRY_SEND_TIMEOUT)
+        except Exception:
+            pass
+
+
+async def telemetry_pump():
+    """
+    Push telemetry to WebSocket clients at the SDK's update rate.
+
+    One SDK read per tick is shared by every connected client, and it also
+    refreshes the cache served by GET /telemetry and the shared memory mirror.
+    Idles while there are no clients and the mirror is disabled. Errors are
+    logged (once until the error changes) and the pump carries on next tick.
+    """
+    last_error = None
+    while True:
+        await asyncio.sleep(TELEMETRY_PUSH_INTERVAL)
+        if not sdk_connected or (not telemetry_clients and telemetry_shm is None):
+            continue
+
+        try:
+            if time.monotonic() - last_telemetry_update >= TELEMETRY_CACHE_TTL:
+                try:
+                    await asyncio.shield(refresh_telemetry())
+                except HTTPException:
+                    # Not connected or nothing cached yet; try again next tick
+                    continue
+
+            frame = telemetry_cache
+            await asyncio.gather(*[push_telemetry(client, frame) for client in list(telemetry_clients)])
+            last_error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if repr(e) != last_error:
+                logger.exception("Telemetry pump error")
+                last_error = repr(e)
+
+
+@app.websocket("/telemetry/ws")
+async def telemetry_stream(websocket: WebSocket):
+    """
+    Stream telemetry to the client as it updates.
+
+    Each binary message is a UTF-8 JSON document with the same fields as
+    GET /telemetry, sent roughly 60 times per second while connected to iRacing.
+    """
+    origin = websocket.headers.get("origin")
+    # WebSockets bypass CORS, so apply the same origin allow list here
+    if origin and origin != WEB_APP_ORIGIN and not re.match(LOCAL_ORIGIN_REGEX, origin):
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    telemetry_clients.add(websocket)
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
+        telemetry_clients.discard(websocket)
+
+
+def write_shared_telemetry(telemetry: TelemetryFrame) -> None:
+    """
+    Publish a telemetry frame to the shared memory mirror.
+
+    Runs under sdk_lock as part of the telemetry read, so there is only ever
+    one writer.
+
+    Args:
+        telemetry: Snapshot to publish.
+    """
+    global telemetry_shm_sequence
+
+    sequence = (telemetry_shm_sequence + 1) & 0xFFFFFFFF  # Odd: write in progress
+    TELEMETRY_SHM_SEQUENCE.pack_into(telemetry_shm, 0, sequence)
+    TELEMETRY_SHM_FRAME.pack_into(
+        telemetry_shm,
+        TELEMETRY_SHM_SEQUENCE.size,
+        *[getattr(telemetry, name) for name in TelemetryFrame.__slots__],
+    )
+    telemetry_shm_sequence = (sequence + 1) & 0xFFFFFFFF
+    TELEMETRY_SHM_SEQUENCE.pack_into(telemetry_shm, 0, telemetry_shm_sequence)
+
+
+def update_fastest_lap(
+    session_results: Optional[Dict[str, Any]],
+    event_id: tuple,
+    current_session: Optional[int],
+) -> float:
+    """
+    Get the fastest lap across all sessions of the current event.
+
+    Results of finished sessions no longer change, so each session's fastest
+    lap is kept in fastest_laps and rescanned only when its result count
+    changes. The session currently running is always rescanned.
+
+    Args:
+        session_results: Parsed SessionInfo section of the session string.
+        event_id: Identifies the event the sessions belong to; the tracker is
+            reset when it changes.
+        current_session: Index of the running session (SessionNum).
+
+    Returns:
+        float: Fastest lap time in seconds (0 if none).
+    """
+    global fastest_laps_event
+
+    if event_id != fastest_laps_event:
+        fastest_laps.clear()
+        fastest_laps_event = event_id
+
+    sessions = (session_results.get("Sessions") or []) if session_results else []
+    for idx, session in enumerate(sessions):
+        results = session.get("ResultsFastestLap") or []
+        tracked = fastest_laps.get(idx)
+        if tracked is not None and tracked[0] == len(results) and idx != current_session:
+            continue
+
+        session_fastest = 0
+        for result in results:
+            if "FastestTime" in result and result["FastestTime"] > 0:
+                if session_fastest == 0 or result["FastestTime"] < session_fastest:
+                    session_fastest = result["FastestTime"]
+        fastest_laps[idx] = (len(results), session_fastest)
+
+    return min((lap for _, lap in fastest_laps.values() if lap > 0), default=0)
+
+
+def _read_session_conditions() -> Dict[str, Any]:
+    """Read the track and weather conditions from the var buffer frozen by the caller."""
+    # Get track temperature (Celsius) - use TrackTempCrew as TrackTemp is deprecated
+    track_temp = ir["TrackTempCrew"] if ir["TrackTempCrew"] is not None else None
+
+    # Get air temperature (Celsius)
+    air_temp = ir["AirTemp"] if ir["AirTemp"] is not None else None
+
+    # Determine track condition (dry/wet) based on track wetness
+    track_wetness = ir["TrackWetness"]
+    if track_wetness is None or not 0 <= track_wetness < len(TRACK_WETNESS_CONDITIONS):
+        track_wetness = 1
+    track_condition = TRACK_WETNESS_CONDITIONS[track_wetness]
+
+    return {
+        "trackTemperature": track_temp,  # Track surface temperature in Celsius
+        "airTemperature": air_temp,  # Air temperature in Celsius
+        "trackCondition": track_condition,  # dry or wet
+        "timestamp": time.time()
+    }
+
+
+def parse_track_length(value: Optional[str]) -> float:
+    """
+    Convert a session info track length such as "5.79 km" to meters.
+
+    Track length is not a telemetry variable; iRacing only publishes it as
+    text in WeekendInfo.
+
+    Args:
+        value: WeekendInfo TrackLength, in km or mi.
+
+    Returns:
+        float: Track length in meters, or 0 if missing or unparseable.
+    """
+    try:
+        length, unit = str(value).split()
+        return float(length) * TRACK_LENGTH_UNITS[unit.lower()]
+    except (ValueError, KeyError):
+        return 0
+
+
+def _read_session_constants(session_id: Optional[int]) -> Optional[SessionConstants]:
+    """
+    Read the fields that stay fixed for a whole session.
+
+    Args:
+        session_id: SessionUniqueID the values belong to.
+
+    Returns:
+        SessionConstants, or None if the session info is not available yet.
+    """
+    session_info = ir["WeekendInfo"]
+    driver_info = ir["DriverInfo"]
+
+    if not session_info or not driver_info:
+        return None
+
+    driver = driver_info["Drivers"][driver_info["DriverCarIdx"]]
+
+    return SessionConstants(
+        session_id=session_id,
+        event_id=(session_info.get("SessionID"), session_info.get("SubSessionID")),
+        track_name=session_info.get("TrackDisplayName", "Unknown"),
+        track_id=session_info.get("TrackID", 0),
+        session_type=session_info.get("SessionType", "Unknown"),
+        driver_name=driver["UserName"],
+        car_name=driver["CarScreenName"],
+        track_length=parse_track_length(session_info.get("TrackLength")),
+    )
+
+
+def _read_session_sync() -> Tuple[bytes, str]:
+    """
+    Read and cache serialized session data. Runs in a worker thread via run_sdk.
+
+    Returns:
+        tuple: (serialized session, its ETag).
+    """
+    global session_cache, session_data, session_cache_key, session_conditions_expiry, session_constants
+    global session_cache_etag
+
+    require_connection()
+
+    try:
+        # Look up the cache key in the live var buffer; a snapshot is only
+        # frozen once something actually has to be re-read
+        ir.unfreeze_var_buffer_latest()
+
+        # Session info only changes when iRacing publishes a new session string
+        cache_key = (ir["SessionUniqueID"], ir._header.session_info_update)
+        now = time.monotonic()
+
+        same_session = session_cache and cache_key == session_cache_key
+        if same_session and now < session_conditions_expiry:
+            return session_cache, session_cache_etag
+
+        # Freeze once so every value read below comes from the same snapshot
         ir.freeze_var_buffer_latest()
 
-        # Get key telemetry values
-        telemetry = {
-            "speed": ir["Speed"] if ir["Speed"] is not None else 0,
-            "rpm": ir["RPM"] if ir["RPM"] is not None else 0,
-            "gear": ir["Gear"] if ir["Gear"] is not None else 0,
-            "throttle": ir["Throttle"] if ir["Throttle"] is not None else 0,
-            "brake": ir["Brake"] if ir["Brake"] is not None else 0,
-            "steering": ir["SteeringWheelAngle"] if ir["SteeringWheelAngle"] is not None else 0,
-            "lapCurrentLapTime": ir["LapCurrentLapTime"] if ir["LapCurrentLapTime"] is not None else 0,
-            "lapLastLapTime": ir["LapLastLapTime"] if ir["LapLastLapTime"] is not None else 0,
-            "lapNumber": ir["Lap"] if ir["Lap"] is not None else 0,
-            "sessionTime": ir["SessionTime"] if ir["SessionTime"] is not None else 0,
-            "sessionTimeRemain": ir["SessionTimeRemain"] if ir["SessionTimeRemain"] is not None else 0,
-            "isOnTrack": ir["IsOnTrack"] if ir["IsOnTrack"] is not None else False,
-            "lapDistPct": ir["LapDistPct"] if ir["LapDistPct"] is not None else 0,  # Lap distance as percentage (0-1)
-            "trackLength": (ir["TrackLength"] * 1000) if ir["TrackLength"] is not None else 0,  # Track length in meters
-            "timestamp": time.time()
-        }
+        if same_session:
+            # Same session, so only the conditions need refreshing
+            session_data.update(_read_session_conditions())
+            session_cache = orjson.dumps(session_data)
+            session_cache_etag = session_etag(session_data)
+            session_conditions_expiry = now + SESSION_CONDITIONS_TTL
+            return session_cache, session_cache_etag
+
+        # Track, car and driver only change with the session itself
+        if session_constants is None or session_constants.session_id != cache_key[0]:
+            constants = _read_session_constants(cache_key[0])
+            if constants is None:
+                if session_cache:
+                    return session_cache, session_cache_etag
+                raise HTTPException(status_code=404, detail="Session info not available")
+            session_constants = constants
+
+        # Get fastest lap from session results
+        fastest_lap = update_fastest_lap(ir["SessionInfo"], session_constants.event_id, ir["SessionNum"])
 
-        telemetry_cache = telemetry
-        last_telemetry_update = time.time()
+        session_data = {
+            "trackName": session_constants.track_name,
+            "trackId": session_constants.track_id,
+            "sessionType": session_constants.session_type,
+            "driverName": session_constants.driver_name,
+            "carName": session_constants.car_name,
+            "fastestLap": fastest_lap,
+            "trackLength": session_constants.track_length,  # Track length in meters
+            **_read_session_conditions()
+        }
 
-        return telemetry
+        session_cache = orjson.dumps(session_data)
+        session_cache_etag = session_etag(session_data)
+        session_cache_key = cache_key
+        session_conditions_expiry = now + SESSION_CONDITIONS_TTL
+        return session_cache, session_cache_etag
 
     except Exception as e:
-        if telemetry_cache:
-            # Return cached data if available
-            return telemetry_cache
-        raise HTTPException(status_code=500, detail=f"Error reading telemetry: {str(e)}")
+        if session_cache:
+            return session_cache, session_cache_etag
+        raise HTTPException(status_code=500, detail=f"Error reading session: {str(e)}")
 
 
-@app.get("/session")
-def get_session():
+def session_etag(data: Dict[str, Any]) -> str:
+    """
+    Compute the ETag of a session payload.
+
+    The timestamp is left out, so refreshing unchanged conditions keeps the
+    ETag and polling clients keep getting 304s.
+
+    Args:
+        data: Session payload as built by _read_session_sync.
+
+    Returns:
+        str: Weak ETag, since the plain and gzipped bodies share it.
+    """
+    content = orjson.dumps({key: value for key, value in data.items() if key != "timestamp"})
+    return 'W/"%s"' % hashlib.blake2b(content, digest_size=8).hexdigest()
+
+
+def strip_weak_prefix(tag: str) -> str:
+    """Drop the W/ prefix of an entity tag, for weak comparison."""
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+@app.get("/session", response_model=Session)
+async def get_session(request: Request):
     """
     Get current session information from iRacing.
 
     Retrieves metadata about the current racing session including track,
-    car, driver information, and fastest lap time.
+    car, driver information, and fastest lap time. The payload is cached
+    until iRacing publishes new session info; temperatures and track
+    condition are refreshed every SESSION_CONDITIONS_TTL seconds.
+    Responses carry an ETag; a matching If-None-Match gets an empty 304.
 
     Returns:
         dict: Session data with fields:
@@ -247,81 +931,54 @@ def get_session():
         HTTPException 404: Session info not yet available
         HTTPException 500: Error reading session data
     """
-    global session_cache
-
-    if not ensure_connection():
+    if not sdk_connected:
         raise HTTPException(status_code=503, detail="Not connected to iRacing")
 
-    try:
-        session_info = ir["WeekendInfo"]
-        driver_info = ir["DriverInfo"]
+    content, etag = await run_sdk(_read_session_sync)
+    headers = {"ETag": etag}
 
-        if not session_info or not driver_info:
-            if session_cache:
-                return session_cache
-            raise HTTPException(status_code=404, detail="Session info not available")
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # If-None-Match uses weak comparison, so W/ is ignored on both sides
+        tags = {strip_weak_prefix(tag.strip()) for tag in if_none_match.split(",")}
+        if strip_weak_prefix(etag) in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
 
-        # Get fastest lap from session results
-        fastest_lap = 0
-        session_results = ir["SessionInfo"]
-        if session_results and "Sessions" in session_results:
-            for session in session_results["Sessions"]:
-                if "ResultsFastestLap" in session:
-                    for result in session["ResultsFastestLap"]:
-                        if "FastestTime" in result and result["FastestTime"] > 0:
-                            if fastest_lap == 0 or result["FastestTime"] < fastest_lap:
-                                fastest_lap = result["FastestTime"]
-
-        # Get track length in meters (TrackLength is in km)
-        track_length_km = ir["TrackLength"] if ir["TrackLength"] is not None else 0
-        track_length_m = track_length_km * 1000  # Convert km to meters
-
-        # Freeze the var buffer to get consistent telemetry values for temperature
-        ir.freeze_var_buffer_latest()
+    return Response(content=content, media_type="application/json", headers=headers)
 
-        # Get track temperature (Celsius) - use TrackTempCrew as TrackTemp is deprecated
-        track_temp = ir["TrackTempCrew"] if ir["TrackTempCrew"] is not None else None
 
-        # Get air temperature (Celsius)
-        air_temp = ir["AirTemp"] if ir["AirTemp"] is not None else None
+@app.post("/disconnect", response_model=DisconnectResult)
+async def disconnect():
+    """Disconnect from iRacing. The watchdog reconnects on its next check."""
+    global sdk_connected
 
-        # Determine track condition (dry/wet) based on track wetness
-        # TrackWetness enum: 0=unknown, 1=dry, 2=mostly_dry, 3=very_lightly_wet,
-        # 4=lightly_wet, 5=moderately_wet, 6=very_wet, 7=extremely_wet
-        track_wetness = ir["TrackWetness"] if ir["TrackWetness"] is not None else 1
-        track_condition = "wet" if track_wetness >= 3 else "dry"
-
-        session_data = {
-            "trackName": session_info.get("TrackDisplayName", "Unknown") if session_info else "Unknown",
-            "trackId": session_info.get("TrackID", 0) if session_info else 0,
-            "sessionType": session_info.get("SessionType", "Unknown") if session_info else "Unknown",
-            "driverName": driver_info["Drivers"][driver_info["DriverCarIdx"]]["UserName"] if driver_info else "Unknown",
-            "carName": driver_info["Drivers"][driver_info["DriverCarIdx"]]["CarScreenName"] if driver_info else "Unknown",
-            "fastestLap": fastest_lap,
-            "trackLength": track_length_m,  # Track length in meters
-            "trackTemperature": track_temp,  # Track surface temperature in Celsius
-            "airTemperature": air_temp,  # Air temperature in Celsius
-            "trackCondition": track_condition,  # dry or wet
-            "timestamp": time.time()
-        }
+    try:
+        await run_sdk(ir.shutdown)
+        sdk_connected = False
+        return ORJSONResponse({"status": "disconnected"})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error disconnecting: {str(e)}")
 
-        session_cache = session_data
-        return session_data
 
-    except Exception as e:
-        if session_cache:
-            return session_cache
-        raise HTTPException(status_code=500, detail=f"Error reading session: {str(e)}")
+def select_event_loop() -> str:
+    """
+    Select the event loop implementation for uvicorn.
 
+    uvloop is POSIX-only, so on Windows the winloop policy is installed
+    instead when available. Falls back to the stock asyncio loop otherwise.
 
-@app.post("/disconnect")
-def disconnect():
-    """Disconnect from iRacing"""
-    try:
-        ir.shutdown()
-        return {"status": "disconnected"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error disconnecting: {str(e)}")
+    Returns:
+        str: Value for the uvicorn.run loop argument.
+    """
+    if sys.platform == "win32":
+        try:
+            import winloop
+        except ImportError:
+            return "asyncio"
+        asyncio.set_event_loop_policy(winloop.EventLoopPolicy())
+        # "none" tells uvicorn to use the event loop policy set above
+        return "none"
+    return "auto"
 
 
 if __name__ == "__main__":
@@ -329,4 +986,11 @@ if __name__ == "__main__":
     print("Listening on http://localhost:5555")
     print("Waiting for iRacing connection...")
 
-    uvicorn.run(app, host="127.0.0.1", port=5555, log_level="info")
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=5555,
+        log_level="info",
+        loop=select_event_loop(),
+        http="httptools",
+    )